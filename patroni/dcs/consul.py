@@ -314,9 +314,15 @@ class Consul(AbstractDCS):
                 raise NotFound
 
             nodes = {}
+            members = []
+            prefix_len = len(path)
             for node in results:
                 node['Value'] = (node['Value'] or b'').decode('utf-8')
-                nodes[node['Key'][len(path):].lstrip('/')] = node
+                key = node['Key'][prefix_len:].lstrip('/')
+                nodes[key] = node
+                # get list of members
+                if key.startswith(self._MEMBERS) and '/' not in key[len(self._MEMBERS):]:
+                    members.append(self.member(node))
 
             # get initialize flag
             initialize = nodes.get(self._INITIALIZE)
@@ -334,9 +340,6 @@ class Consul(AbstractDCS):
             last_leader_operation = nodes.get(self._LEADER_OPTIME)
             last_leader_operation = 0 if last_leader_operation is None else int(last_leader_operation['Value'])
 
-            # get list of members
-            members = [self.member(n) for k, n in nodes.items() if k.startswith(self._MEMBERS) and k.count('/') == 1]
-
             # get leader
             leader = nodes.get(self._LEADER)
             if not self._ctl and leader and leader['Value'] == self._name \
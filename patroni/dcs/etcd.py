@@ -505,7 +505,15 @@ class Etcd(AbstractDCS):
         cluster = None
         try:
             result = self.retry(self._client.read, self.client_path(''), recursive=True)
-            nodes = {node.key[len(result.key):].lstrip('/'): node for node in result.leaves}
+            nodes = {}
+            members = []
+            prefix_len = len(result.key)
+            for node in result.leaves:
+                key = node.key[prefix_len:].lstrip('/')
+                nodes[key] = node
+                # get list of members
+                if key.startswith(self._MEMBERS) and '/' not in key[len(self._MEMBERS):]:
+                    members.append(self.member(node))
 
             # get initialize flag
             initialize = nodes.get(self._INITIALIZE)
@@ -523,9 +531,6 @@ class Etcd(AbstractDCS):
             last_leader_operation = nodes.get(self._LEADER_OPTIME)
             last_leader_operation = 0 if last_leader_operation is None else int(last_leader_operation.value)
 
-            # get list of members
-            members = [self.member(n) for k, n in nodes.items() if k.startswith(self._MEMBERS) and k.count('/') == 1]
-
             # get leader
             leader = nodes.get(self._LEADER)
             if leader: